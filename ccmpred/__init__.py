@@ -18,10 +18,6 @@ import ccmpred.plotting
 import ccmpred.sampling
 import ccmpred.weighting
 import ccmpred.monitor.progress as pr
-import ccmpred.objfun.pll as pll
-import ccmpred.objfun.cd as cd
-import ccmpred.algorithm.gradient_descent as gd
-import ccmpred.algorithm.lbfgs as lbfgs
 
 
 class CCMpred():
@@ -465,28 +461,46 @@ class CCMpred():
 
     def minimize(self, opt, plotfile=None):
 
-        OBJ_FUNC = {
-            "pll": lambda opt: pll.PseudoLikelihood(
-                self.msa, self.weights, self.regularization, self.pseudocounts, self.x_single, self.x_pair),
-            "cd": lambda opt: cd.ContrastiveDivergence(
+        # objective functions and optimizers are imported only once selected
+        # (ccmpred.objfun.cd is already loaded via ccmpred.sampling, pll/lbfgs/gd are deferred)
+        def pseudo_likelihood(opt):
+            import ccmpred.objfun.pll as pll
+            return pll.PseudoLikelihood(
+                self.msa, self.weights, self.regularization, self.pseudocounts, self.x_single, self.x_pair)
+
+        def contrastive_divergence(opt):
+            import ccmpred.objfun.cd as cd
+            return cd.ContrastiveDivergence(
                 self.msa, self.weights, self.regularization, self.pseudocounts, self.x_single, self.x_pair,
                 gibbs_steps=opt.cd_gibbs_steps,
                 nr_seq_sample=opt.nr_seq_sample,
                 persistent=opt.cd_persistent
             )
-        }
 
-        ALGORITHMS = {
-            "pll": lambda opt: lbfgs.LBFGS(
+        def lbfgs_optimizer(opt):
+            import ccmpred.algorithm.lbfgs as lbfgs
+            return lbfgs.LBFGS(
                 self.progress, maxit=opt.maxit, ftol=opt.ftol, max_linesearch=opt.max_linesearch, maxcor=opt.max_cor,
                 non_contact_indices=self.non_contact_indices
-            ),
-            "cd": lambda opt: gd.gradientDescent(
+            )
+
+        def gradient_descent_optimizer(opt):
+            import ccmpred.algorithm.gradient_descent as gd
+            return gd.gradientDescent(
                 self.progress, self.neff, maxit=opt.maxit, alpha0=opt.alpha0, decay=opt.decay, decay_start=opt.decay_start,
                 decay_rate=opt.decay_rate, decay_type=opt.decay_type, epsilon=opt.epsilon,
                 convergence_prev=opt.convergence_prev, early_stopping=True,
                 non_contact_indices=self.non_contact_indices,
             )
+
+        OBJ_FUNC = {
+            "pll": pseudo_likelihood,
+            "cd": contrastive_divergence
+        }
+
+        ALGORITHMS = {
+            "pll": lbfgs_optimizer,
+            "cd": gradient_descent_optimizer
         }
 
         #initialize objective function
@@ -620,11 +634,13 @@ class CCMpred():
             io.contactmatrix.write_matrix(mat_dict['mat_file'], mat, meta)
             print("\t" + mat_dict['mat_file'])
 
-    def write_binary_raw(self, out_binary_raw_file):
+    def write_binary_raw(self, out_binary_raw_file, single_float=False, compresslevel=raw.GZIP_COMPRESSLEVEL):
         """
         Write single and pair potentials including meta data to msgpack-formatted binary raw file
 
         :param out_binary_raw_file: path to out file
+        :param single_float: write potentials with single (float32) instead of double precision
+        :param compresslevel: gzip compression level (1-9) if out file ends with .gz
         :return:
         """
 
@@ -638,5 +654,5 @@ class CCMpred():
 
         raw_out = raw.CCMRaw(self.L, self.x_single[:, :20], self.x_pair[:, :, :21, :21], meta)
         print("\nWriting msgpack-formatted potentials to {0}".format(out_binary_raw_file))
-        raw.write_msgpack(out_binary_raw_file, raw_out)
+        raw.write_msgpack(out_binary_raw_file, raw_out, single_float=single_float, compresslevel=compresslevel)
 
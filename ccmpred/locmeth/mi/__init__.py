@@ -27,7 +27,8 @@ def compute_mi(counts, normalized=False):
 
     #compute mutual information
     mi = np.zeros((L, L))
-    mi[indices_i_less_j] =  [shannon_entropy[i] + shannon_entropy[j] - joint_shannon_entropy[i,j] for i,j in zip(*indices_i_less_j)]
+    mi[indices_i_less_j] = shannon_entropy[indices_i_less_j[0]] + shannon_entropy[indices_i_less_j[1]] - \
+                           joint_shannon_entropy[indices_i_less_j]
 
     #According to Martin et al 2005
     if normalized:
@@ -54,7 +55,8 @@ def compute_mi_pseudocounts(freqs):
     # print single_freqs[indices_i_less_j[0]][10,4] * single_freqs[indices_i_less_j[1]][10,7]
     # print single_freqs[indices_i_less_j[0]][10,7] * single_freqs[indices_i_less_j[1]][10,4]
 
-    mi_raw = pair_freqs[indices_i_less_j][:, :20, :20] * np.log2(pair_freqs[indices_i_less_j][:, :20, :20] / (single_freqs[indices_i_less_j[0]][:, :20, np.newaxis] * single_freqs[indices_i_less_j[1]][:, np.newaxis, :20]) )
+    pair_freqs_i_less_j = pair_freqs[indices_i_less_j][:, :20, :20]
+    mi_raw = pair_freqs_i_less_j * np.log2(pair_freqs_i_less_j / (single_freqs[indices_i_less_j[0]][:, :20, np.newaxis] * single_freqs[indices_i_less_j[1]][:, np.newaxis, :20]) )
 
 
     mi[indices_i_less_j] = mi_raw.sum(2).sum(1)
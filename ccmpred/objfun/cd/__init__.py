@@ -144,14 +144,17 @@ class ContrastiveDivergence():
                 self.pseudocount_n_pair,
                 remove_gaps=False)
 
-        #compute frequencies excluding gap counts
-        sampled_freq_single = pseudocounts.degap(pseudocounts.freqs[0], True)
-        sampled_freq_pair   = pseudocounts.degap(pseudocounts.freqs[1], True)
-
-
-        #compute counts and scale them accordingly to size of original MSA
-        sample_counts_single    = sampled_freq_single * self.Ni[:, np.newaxis]
-        sample_counts_pair      = sampled_freq_pair * self.Nij[:, :, np.newaxis, np.newaxis]
+        #compute counts excluding gap counts and scale them accordingly to size of original MSA
+        #degapping (as in PseudoCounts.degap) and rescaling are combined into one factor per position (pair),
+        #so the L x L x 20 x 20 pair frequencies are only multiplied once instead of divided and multiplied
+        sampled_freq_single, sampled_freq_pair = pseudocounts.freqs
+        scale_single = self.Ni / (1 - sampled_freq_single[:, 20])
+        scale_pair = self.Nij / (sampled_freq_pair[:, :, :20, :20].sum(axis=(2, 3)) + 1e-10)
+
+        sample_counts_single = np.zeros((self.ncol, 21))
+        sample_counts_single[:, :20] = sampled_freq_single[:, :20] * scale_single[:, np.newaxis]
+        sample_counts_pair = np.zeros((self.ncol, self.ncol, 21, 21))
+        sample_counts_pair[:, :, :20, :20] = sampled_freq_pair[:, :, :20, :20] * scale_pair[:, :, np.newaxis, np.newaxis]
 
         #actually compute the gradients
         g_single = sample_counts_single - self.msa_counts_single
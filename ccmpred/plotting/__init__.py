@@ -61,25 +61,25 @@ def plot_contact_map_someScore_plotly(plot_matrix, title, seqsep, gaps_percentag
 
     data = []
 
+    # convert columns to lists only once (not once per residue pair)
+    residue_i = plot_matrix.residue_i.tolist()
+    residue_j = plot_matrix.residue_j.tolist()
+    confidence = plot_matrix.confidence.tolist()
 
     hover_text = ["residue i: {0}<br>residue j: {1}<br>score: {2}".format(
-                plot_matrix.residue_i.tolist()[i],
-                plot_matrix.residue_j.tolist()[i],
-                np.round(plot_matrix.confidence.tolist()[i], decimals=3))
-                for i in range(len(plot_matrix.residue_i.tolist()))]
+                i, j, np.round(c, decimals=3))
+                for i, j, c in zip(residue_i, residue_j, confidence)]
 
     hover_text  += ["residue i: {0}<br>residue j: {1}<br>score: {2}".format(
-                plot_matrix.residue_j.tolist()[i],
-                plot_matrix.residue_i.tolist()[i],
-                np.round(plot_matrix.confidence.tolist()[i], decimals=3))
-                for i in range(len(plot_matrix.residue_i.tolist()))]
+                j, i, np.round(c, decimals=3))
+                for i, j, c in zip(residue_i, residue_j, confidence)]
 
     # add predicted contact map
     data.append(
         go.Heatmap(
-            x=plot_matrix.residue_i.tolist() + plot_matrix.residue_j.tolist(),
-            y=plot_matrix.residue_j.tolist() + plot_matrix.residue_i.tolist(),
-            z=plot_matrix.confidence.tolist() + plot_matrix.confidence.tolist(),
+            x=residue_i + residue_j,
+            y=residue_j + residue_i,
+            z=confidence + confidence,
             name='predicted',
             hoverinfo="text",
             text=hover_text,
@@ -107,26 +107,22 @@ def plot_contact_map_someScore_plotly(plot_matrix, title, seqsep, gaps_percentag
                                [1, 'rgb(22, 96, 167)']]
 
 
+        distance = plot_matrix.distance.tolist()
+
         hover_text = ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                plot_matrix.residue_i.tolist()[i],
-                plot_matrix.residue_j.tolist()[i],
-                np.round(plot_matrix.confidence.tolist()[i], decimals=3),
-                np.round(plot_matrix.distance.tolist()[i], decimals=3))
-                for i in range(len(plot_matrix.residue_i.tolist()))]
+                i, j, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(residue_i, residue_j, confidence, distance)]
 
         hover_text += ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                plot_matrix.residue_j.tolist()[i],
-                plot_matrix.residue_i.tolist()[i],
-                np.round(plot_matrix.confidence.tolist()[i], decimals=3),
-                np.round(plot_matrix.distance.tolist()[i], decimals=3))
-                for i in range(len(plot_matrix.residue_i.tolist()))]
+                j, i, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(residue_i, residue_j, confidence, distance)]
 
         # define triangle on opposite site of Predictions
         data.append(
             go.Heatmap(
-                x=plot_matrix.residue_j.tolist(),
-                y=plot_matrix.residue_i.tolist(),
-                z=plot_matrix.distance.tolist(),
+                x=residue_j,
+                y=residue_i,
+                z=distance,
                 name='observed',
                 hoverinfo="text",
                 text=hover_text,
@@ -147,19 +143,15 @@ def plot_contact_map_someScore_plotly(plot_matrix, title, seqsep, gaps_percentag
         sub_L5_true = plot_matrix.query('distance > 0').head(int(L / 5)).query('contact > 0')
         sub_L5_false = plot_matrix.query('distance > 0').head(int(L / 5)).query('contact < 1')
 
+        tp_columns = [sub_L5_true[col].tolist() for col in ['residue_i', 'residue_j', 'confidence', 'distance']]
+
         tp_text = ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                sub_L5_true.residue_i.tolist()[i],
-                sub_L5_true.residue_j.tolist()[i],
-                np.round(sub_L5_true.confidence.tolist()[i], decimals=3),
-                np.round(sub_L5_true.distance.tolist()[i], decimals=3))
-                for i in range(len(sub_L5_true.residue_i.tolist()))]
+                i, j, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(*tp_columns)]
 
         tp_text += ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                sub_L5_true.residue_j.tolist()[i],
-                sub_L5_true.residue_i.tolist()[i],
-                np.round(sub_L5_true.confidence.tolist()[i], decimals=3),
-                np.round(sub_L5_true.distance.tolist()[i], decimals=3))
-                for i in range(len(sub_L5_true.residue_i.tolist()))]
+                j, i, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(*tp_columns)]
 
         if len(sub_L5_true) > 0:
             # Mark TP and FP in the plot with little crosses
@@ -180,19 +172,15 @@ def plot_contact_map_someScore_plotly(plot_matrix, title, seqsep, gaps_percentag
                 )
             )
 
+        fp_columns = [sub_L5_false[col].tolist() for col in ['residue_i', 'residue_j', 'confidence', 'distance']]
+
         fp_text = ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                sub_L5_false.residue_i.tolist()[i],
-                sub_L5_false.residue_j.tolist()[i],
-                np.round(sub_L5_false.confidence.tolist()[i], decimals=3),
-                np.round(sub_L5_false.distance.tolist()[i], decimals=3))
-                for i in range(len(sub_L5_false.residue_i.tolist()))]
+                i, j, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(*fp_columns)]
 
         fp_text += ["residue i: {0}<br>residue j: {1}<br>score: {2}<br>distance: {3}".format(
-                sub_L5_false.residue_j.tolist()[i],
-                sub_L5_false.residue_i.tolist()[i],
-                np.round(sub_L5_false.confidence.tolist()[i], decimals=3),
-                np.round(sub_L5_false.distance.tolist()[i], decimals=3))
-                for i in range(len(sub_L5_false.residue_i.tolist()))]
+                j, i, np.round(c, decimals=3), np.round(d, decimals=3))
+                for i, j, c, d in zip(*fp_columns)]
 
         if len(sub_L5_false) > 0:
             data.append(
@@ -38,10 +38,8 @@ class PseudoCounts(object):
         else:
             single_counts, pair_counts = self.counts
 
-        # reset gap counts
-        single_counts[:, 20] = 0
-
-        Ni = single_counts.sum(1)
+        # non_gapped counts (sum over amino acids only, leaving the counts untouched)
+        Ni = single_counts[:, :20].sum(1)
 
         self.Ni = Ni
 
@@ -53,12 +51,8 @@ class PseudoCounts(object):
         else:
             single_counts, pair_counts = self.counts
 
-        # reset gap counts
-        pair_counts[:, :, :, 20] = 0
-        pair_counts[:, :, 20, :] = 0
-
-        # non_gapped counts
-        Nij = pair_counts.sum(3).sum(2)
+        # non_gapped counts (sum over amino acid pairs only, leaving the counts untouched)
+        Nij = pair_counts[:, :, :20, :20].sum(axis=(2, 3))
 
         self.Nij = Nij
 
@@ -1 +1 @@
-from ccmpred.raw.ccmraw import parse_oldraw, parse_msgpack, parse, write_msgpack, write_oldraw, CCMRaw
+from ccmpred.raw.ccmraw import parse_oldraw, parse_msgpack, parse, write_msgpack, write_oldraw, CCMRaw, GZIP_COMPRESSLEVEL
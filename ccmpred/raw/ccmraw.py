@@ -4,11 +4,21 @@ import numpy as np
 import re
 import json
 import gzip
-from six import string_types, StringIO
+from io import StringIO
+
+try:
+    import msgspec.msgpack
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 
 META_PREFIX = "#>META> "
 
+# gzip level used when writing to *.gz files: much faster than gzip's default of 9, and msgpack-encoded
+# floats hardly compress any better at higher levels
+GZIP_COMPRESSLEVEL = 3
+
 
 class CCMRaw(object):
     """Storage class for CCMpred raw prediction"""
@@ -23,17 +33,27 @@ class CCMRaw(object):
 
 
 def stream_or_file(mode='r'):
-    """Decorator for making a function accept either a filename or file-like object as a first argument"""
+    """Decorator for making a function accept either a filename or file-like object as a first argument
+
+    Filenames ending in .gz are opened with gzip. In write mode, the wrapped function additionally accepts a
+    compresslevel keyword argument for the gzip compression level.
+    """
 
     def inner(fn):
         @functools.wraps(fn)
         def streamify(f, *args, **kwargs):
-            if isinstance(f, string_types):
+            gzip_kwargs = {}
+            if 'w' in mode:
+                gzip_kwargs['compresslevel'] = kwargs.pop('compresslevel', GZIP_COMPRESSLEVEL)
+
+            if isinstance(f, str):
 
-                open_fn = gzip.open if f.endswith(".gz") else open
+                if f.endswith(".gz"):
+                    fh = gzip.open(f, mode, **gzip_kwargs)
+                else:
+                    fh = open(f, mode)
 
                 try:
-                    fh = open_fn(f, mode)
                     res = fn(fh, *args, **kwargs)
                 finally:
                     fh.close()
@@ -47,6 +67,18 @@ def stream_or_file(mode='r'):
     return inner
 
 
+def _encode_numpy_scalar(obj):
+    # meta data may contain numpy scalars (e.g. neff), which neither msgspec nor msgpack know about
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError("Cannot encode objects of type {0}".format(type(obj)))
+
+
+if HAS_MSGSPEC:
+    _MSGSPEC_ENCODER = msgspec.msgpack.Encoder(enc_hook=_encode_numpy_scalar)
+    _MSGSPEC_DECODER = msgspec.msgpack.Decoder()
+
+
 _PARSERS = []
 
 
@@ -59,7 +91,10 @@ def parser(fn):
 @stream_or_file('rb')
 def parse_msgpack(f):
     """Parse a msgpack CCMpred prediction from a filename or file object"""
-    x = msgpack.unpackb(f.read(), encoding="utf-8")
+    if HAS_MSGSPEC:
+        x = _MSGSPEC_DECODER.decode(f.read())
+    else:
+        x = msgpack.unpackb(f.read(), raw=False)
 
     assert(x['format'] == 'ccm-1')
 
@@ -69,12 +104,13 @@ def parse_msgpack(f):
 
     meta = x['meta'] if 'meta' in x else None
 
-    for p in x['x_pair'].values():
-        i = p['i']
-        j = p['j']
-        mat = np.array(p['x']).reshape((21, 21))
-        x_pair[i, j, :, :] = mat
-        x_pair[j, i, :, :] = mat.T
+    # convert all pair potentials at once and scatter them to both triangles in two bulk assignments
+    pairs = list(x['x_pair'].values())
+    i = np.array([p['i'] for p in pairs], dtype=int)
+    j = np.array([p['j'] for p in pairs], dtype=int)
+    mats = np.array([p['x'] for p in pairs]).reshape((-1, 21, 21))
+    x_pair[i, j, :, :] = mats
+    x_pair[j, i, :, :] = mats.transpose((0, 2, 1))
 
     return CCMRaw(ncol, x_single, x_pair, meta)
 
@@ -145,30 +181,82 @@ def parse(f):
     return r
 
 
+# msgpack encodes every float64 (float32) as a 0xcb (0xca) marker byte followed by the big-endian IEEE 754 value
+_MSGPACK_FLOAT64 = np.dtype([('marker', 'u1'), ('value', '>f8')])
+_MSGPACK_FLOAT32 = np.dtype([('marker', 'u1'), ('value', '>f4')])
+
+
+def _msgpack_float_array(shape, single_float=False):
+    """Allocate an array of msgpack floats, to be filled via its 'value' field
+
+    This encodes floats without materializing Python floats: the bytes are identical to what msgpack
+    produces for a list of the same floats. The array can be sliced along leading axes before writing it.
+    """
+    dtype = _MSGPACK_FLOAT32 if single_float else _MSGPACK_FLOAT64
+
+    out = np.empty(shape, dtype=dtype)
+    out['marker'] = 0xca if single_float else 0xcb
+    return out
+
+
+@functools.lru_cache(maxsize=16)
+def _triu_indices(ncol):
+    """Cached (read-only) indices of all pairs i < j for a protein of length ncol"""
+    indices_triu = np.triu_indices(ncol, k=1)
+    for ind in indices_triu:
+        ind.setflags(write=False)
+    return indices_triu
+
+
 @stream_or_file('wb')
-def write_msgpack(f, data):
+def write_msgpack(f, data, single_float=False):
+    """Write a CCMpred prediction in msgpack format to a filename or file object
 
-    x_single = data.x_single.reshape(data.ncol * 20).tolist()
-    x_pair = {}
-    for i in range(data.ncol):
-        for j in range(i + 1, data.ncol):
-            x_pair["{0}/{1}".format(i, j)] = {
-                "i": i,
-                "j": j,
-                "x": data.x_pair[i, j, :, :].reshape(21 * 21).tolist()
-            }
-
-    out = {
-        "format": "ccm-1",
-        "ncol": data.ncol,
-        "x_single": x_single,
-        "x_pair": x_pair
-    }
+    :param single_float: store potentials as float32 instead of float64 (halves the file size)
+    :param compresslevel: gzip compression level (1-9); only applies when f is a filename ending in .gz
+    """
 
-    if data.meta:
-        out['meta'] = data.meta
+    packer = msgpack.Packer(default=_encode_numpy_scalar)
+
+    x_single = _msgpack_float_array(data.ncol * 20, single_float)
+    x_single['value'] = data.x_single.reshape(data.ncol * 20)
+
+    indices_triu = _triu_indices(data.ncol)
+
+    # header of every ["x"] entry, everything after it is the raw float payload
+    x_header = packer.pack("x") + packer.pack_array_header(21 * 21)
 
-    f.write(msgpack.packb(out))
+    # stream the document to f piece by piece instead of assembling the whole file in memory first
+    f.write(packer.pack_map_header(5 if data.meta else 4))
+    f.write(packer.pack("format") + packer.pack("ccm-1"))
+    f.write(packer.pack("ncol") + packer.pack(data.ncol))
+
+    f.write(packer.pack("x_single") + packer.pack_array_header(data.ncol * 20))
+    f.write(x_single.tobytes())
+
+    f.write(packer.pack("x_pair") + packer.pack_map_header(len(indices_triu[0])))
+
+    # copy the i < j pair potentials row by row straight into their final row-major position,
+    # without first gathering them into a temporary (pairs, 21, 21) copy
+    x_pair_triu = _msgpack_float_array((len(indices_triu[0]), 21, 21), single_float)
+    start = 0
+    for i in range(data.ncol - 1):
+        end = start + data.ncol - i - 1
+        x_pair_triu['value'][start:end] = data.x_pair[i, i + 1:]
+        start = end
+
+    for i, j, x in zip(indices_triu[0].tolist(), indices_triu[1].tolist(), x_pair_triu.reshape(-1, 21 * 21)):
+        f.write(
+            packer.pack("{0}/{1}".format(i, j)) + packer.pack_map_header(3) +
+            packer.pack("i") + packer.pack(i) + packer.pack("j") + packer.pack(j) + x_header
+        )
+        f.write(x.view(np.uint8))
+
+    if data.meta:
+        if HAS_MSGSPEC:
+            f.write(packer.pack("meta") + _MSGSPEC_ENCODER.encode(data.meta))
+        else:
+            f.write(packer.pack("meta") + packer.pack(data.meta))
 
 
 @stream_or_file('wb')
@@ -84,10 +84,9 @@ def generate_mcmc_sample(x, ncol, msa, size=10000, burn_in=500, sample_type="ori
             #find gaps in randomly selected original sequences
             sample_seq_id = np.random.choice(N, sample_size_per_it, replace=False)
             msa_sampled_orig = msa[sample_seq_id]
-            gap_indices = np.where(msa_sampled_orig == AMINO_ACIDS.index('-'))
 
-            #assign gap states to random sequences
-            msa_sampled[gap_indices] = AMINO_ACIDS.index('-')
+            #assign gap states to random sequences (masked in-place copy, no index arrays needed)
+            np.copyto(msa_sampled, AMINO_ACIDS.index('-'), where=(msa_sampled_orig == AMINO_ACIDS.index('-')))
 
 
         # burn in phase to move away from initial sequences
@@ -3,12 +3,20 @@ import numpy as np
 
 def check_single_potentials(x_single, verbose=0, epsilon=1e-5):
 
-    nr_pot_sum_not_zero = np.where(np.abs(x_single.sum(1)) > epsilon)[0]
-    if len(nr_pot_sum_not_zero) > 0:
-        print("Warning: {0} single potentials do not sum to 0 (eps={1}).".format(len(nr_pot_sum_not_zero), epsilon))
+    pot_sum = x_single.sum(1)
+
+    # NaNs are reported on their own: re-centering would only spread them
+    nr_pot_sum_nan = np.count_nonzero(np.isnan(pot_sum))
+    if nr_pot_sum_nan:
+        print("Warning: {0} single potentials contain NaN.".format(nr_pot_sum_nan))
+
+    pot_sum_not_zero = np.abs(pot_sum) > epsilon
+    nr_pot_sum_not_zero = np.count_nonzero(pot_sum_not_zero)
+    if nr_pot_sum_not_zero:
+        print("Warning: {0} single potentials do not sum to 0 (eps={1}).".format(nr_pot_sum_not_zero, epsilon))
 
         if verbose:
-            for ind in nr_pot_sum_not_zero[:10]:
+            for ind in np.flatnonzero(pot_sum_not_zero)[:10]:
                 print("e.g.: i={0:<2} has sum_a(v_ia)={1}".format(ind+1, np.sum(x_single[ind])))
 
         return 0
@@ -18,12 +26,20 @@ def check_single_potentials(x_single, verbose=0, epsilon=1e-5):
 def check_pair_potentials(x_pair, verbose=0, epsilon=1e-5):
 
     indices_triu = np.triu_indices(x_pair.shape[0], 1)
-    nr_pot_sum_not_zero = np.where(np.abs(x_pair.sum(2).sum(2)[indices_triu]) > epsilon)[0]
-    if len(nr_pot_sum_not_zero):
-        print("Warning: {0}/{1} pair potentials do not sum to 0 (eps={2}).".format(len(nr_pot_sum_not_zero), len(indices_triu[0]), epsilon))
+    pot_sum = x_pair.sum(axis=(2, 3))[indices_triu]
+
+    # NaNs are reported on their own: re-centering would only spread them
+    nr_pot_sum_nan = np.count_nonzero(np.isnan(pot_sum))
+    if nr_pot_sum_nan:
+        print("Warning: {0}/{1} pair potentials contain NaN.".format(nr_pot_sum_nan, len(indices_triu[0])))
+
+    pot_sum_not_zero = np.abs(pot_sum) > epsilon
+    nr_pot_sum_not_zero = np.count_nonzero(pot_sum_not_zero)
+    if nr_pot_sum_not_zero:
+        print("Warning: {0}/{1} pair potentials do not sum to 0 (eps={2}).".format(nr_pot_sum_not_zero, len(indices_triu[0]), epsilon))
 
         if verbose:
-            for ind in nr_pot_sum_not_zero[:10]:
+            for ind in np.flatnonzero(pot_sum_not_zero)[:10]:
                 i = indices_triu[0][ind]
                 j = indices_triu[1][ind]
                 print("e.g.: i={0:<2} j={1:<2} has sum_ab(w_ijab)={2}".format(i+1, j+1, np.sum(x_pair[i,j])))
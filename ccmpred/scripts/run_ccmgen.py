@@ -2,6 +2,7 @@
 
 import argparse
 import os
+import threadpoolctl
 from ccmpred import CCMpred
 import ccmpred.logo
 import ccmpred.io.alignment
@@ -132,7 +133,9 @@ def main():
 
     ccmpred.logo.logo(what_for="ccmgen")
 
-    # set OMP environment variable for number of threads
+    # set number of threads for OpenMP (C extensions) and BLAS: both runtimes have already been loaded with
+    # the ccmpred package, so OMP_NUM_THREADS would be ignored and the limit is set on the loaded libraries
+    threadpoolctl.threadpool_limits(limits=opt.num_threads)
     os.environ['OMP_NUM_THREADS'] = str(opt.num_threads)
     print("Using {0} threads for OMP parallelization.".format(os.environ["OMP_NUM_THREADS"]))
 
@@ -2,9 +2,11 @@
 import argparse
 import sys
 import os
+import threadpoolctl
 
 from ccmpred import CCMpred
 import ccmpred.logo
+import ccmpred.raw
 
 
 EPILOG = """
@@ -46,6 +48,13 @@ def parse_args():
                          help="Write contact score matrix to file. [default: %(default)s]")
     grp_out.add_argument("-b", "--write-binary-raw", dest="out_binary_raw_file", type=str,
                          help="Write single and pairwise potentials as binary MessagePack file. [default: %(default)s]")
+    grp_out.add_argument("--binary-raw-float32", dest="binary_raw_float32", default=False, action="store_true",
+                         help="Store potentials in the binary MessagePack file with single (float32) instead of "
+                              "double precision. Halves the file size. [default: %(default)s]")
+    grp_out.add_argument("--compress-level", dest="compresslevel", type=int,
+                         default=ccmpred.raw.GZIP_COMPRESSLEVEL, choices=range(1, 10), metavar="{1..9}",
+                         help="gzip compression level for binary MessagePack files ending with .gz. "
+                              "[default: %(default)s]")
     grp_out.add_argument("--plot-opt-progress", dest="plot_opt_progress", type=str,
                          help="Continously plot optimization progress as an interactive HTML. [default: %(default)s]")
 
@@ -203,7 +212,9 @@ def main():
     if opt.logo:
         ccmpred.logo.logo()
 
-    # set OMP environment variable for number of threads
+    # set number of threads for OpenMP (C extensions) and BLAS: both runtimes have already been loaded with
+    # the ccmpred package, so OMP_NUM_THREADS would be ignored and the limit is set on the loaded libraries
+    threadpoolctl.threadpool_limits(limits=opt.num_threads)
     os.environ['OMP_NUM_THREADS'] = str(opt.num_threads)
     print("Using {0} threads for OMP parallelization.".format(os.environ["OMP_NUM_THREADS"]))
 
@@ -286,7 +297,8 @@ def main():
 
     # write model parameters in binary format
     if opt.out_binary_raw_file:
-        ccm.write_binary_raw(opt.out_binary_raw_file)
+        ccm.write_binary_raw(opt.out_binary_raw_file, single_float=opt.binary_raw_float32,
+                             compresslevel=opt.compresslevel)
 
 
     exitcode = 0
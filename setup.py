@@ -12,7 +12,8 @@ setup(
     author_email="Susann.Vorberg@gmail.com",
     url="https://github.com/soedinglab/ccmgen",
     packages=find_packages(),
-    install_requires=['msgpack-python', 'numpy', 'plotly==3.0.0rc10', 'scipy', 'pandas', 'biopython', 'colorlover'],
+    install_requires=['msgpack-python', 'numpy', 'threadpoolctl', 'plotly==3.0.0rc10', 'scipy', 'pandas', 'biopython', 'colorlover'],
+    extras_require={'msgspec': ['msgspec']},
     ext_modules=[
         ext(
             'ccmpred.objfun.pll.cext.libpll',